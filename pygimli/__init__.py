@@ -14,14 +14,13 @@ from .core import (BVector, CVector, DataContainer, DataContainerERT,
                    IVector, Line, Mesh, Plane, Pos, PosVector,
                    RVector3, Vector, PosList, abs, cat, center, exp, find,
                    interpolate, log, log10, logDropTol, max,
-                   mean, median, min, search, setDebug, setThreadCount, sort,
+                   mean, median, min, search, setThreadCount, sort,
                    Stopwatch, sum, trans, unique, versionStr, x, y, z, zero)
 
 from .core import (isInt, isScalar, isIterable, isArray, isPos, isPosList,
                    isR3Array, isComplex, isMatrix)
 
 from .core import math # alias all from .core.math.* to pg.math.*
-# from .core import matrix # alias all from .core.matrix.* to pg.matrix.*
 from .core.matrix import (BlockMatrix, Matrix, SparseMapMatrix, SparseMatrix)
 
 from .core.logger import (_, _d, _g, _r, _y, _b, critical, d, debug,
@@ -39,21 +38,57 @@ from .utils import boxprint, cache, cut, unique, unit, cmap, randn
 from .utils import prettify as pf
 from .utils.utils import Report
 
-from .viewer import show, wait, noShow, hold
+# expensive submodules (viewer, frameworks, testing) are imported lazily on
+# first access of one of these names, see __getattr__ below
+__lazyImports__ = {'show': 'viewer', 'wait': 'viewer', 'noShow': 'viewer',
+                   'hold': 'viewer',
+                   'fit': 'frameworks', 'Modelling': 'frameworks',
+                   'Inversion': 'frameworks',
+                   'test': 'testing',
+                   }
+
+
+def __getattr__(name):
+    """Lazy import of expensive submodules and their names (PEP 562)."""
+    import importlib
+
+    if name in __lazyImports__:
+        mod = importlib.import_module('.' + __lazyImports__[name], __name__)
+        val = getattr(mod, name)
+    elif name in __lazyImports__.values():
+        val = importlib.import_module('.' + name, __name__)
+    else:
+        raise AttributeError(
+            f"module '{__name__}' has no attribute '{name}'")
+
+    globals()[name] = val  # cache, __getattr__ is not called again
+    return val
+
+
+def __dir__():
+    """List lazily imported names too, e.g., for tab completion."""
+    return sorted(set(globals()) | set(__lazyImports__) |
+                  set(__lazyImports__.values()))
 
-from .frameworks import fit
-from .frameworks import Modelling
-from .frameworks import Inversion
-from .testing import test  #, setTestingMode, testingMode
 
 from .math import matrix  # alias all from .core.matrix.* to pg.matrix.*
 from .core.load import (load, optImport, getCachePath,
                         getExampleFile, getExampleData)
 
 
+_localeFixed = False
+
+
 def checkAndFixLocaleDecimal_point(verbose=False):  # verbose overwritten
+    """Set numeric locale to 'C' to ensure decimal point '.'.
+
+    Does nothing if the locale has already been fixed and not been reset
+    since then (e.g. by matplotlib).
     """
-    """
+    global _localeFixed
+    if _localeFixed and locale.localeconv()['decimal_point'] == '.':
+        return
+
     if locale.localeconv()['decimal_point'] == ',':
         if verbose:
             print("Found locale decimal_point ',' "
@@ -61,6 +96,7 @@ def checkAndFixLocaleDecimal_point(verbose=False):  # verbose overwritten
     try:
         locale.localeconv()['decimal_point']
         locale.setlocale(locale.LC_NUMERIC, 'C')
+        _localeFixed = True
     except Exception as e:
         print(e)
         print('cannot set locale to decimal point')
@@ -115,6 +151,9 @@ def findVersion(cache=True):  # careful: cache is already imported!
     """
     Find current version either generated by versioneer or from local cache
     to avoid extensive git systemcalls.
+
+    The cache is refreshed if git index or _version.py of this installation
+    changed since it was written. Call with cache=False to enforce an update.
     """
     import os
     global __version__
@@ -124,30 +163,26 @@ def findVersion(cache=True):  # careful: cache is already imported!
     gitPath = os.path.join(root, '.git')
     gitIndexFile = os.path.join(gitPath, 'index')
     versionCacheFile = os.path.join(getCachePath(), 'VERSION')
-    versionPyFile = os.path.abspath(os.path.join(__file__, "_version.py"))
-
-    loadCache = False
-
-    if os.path.exists(versionCacheFile) and os.path.exists(gitIndexFile):
-        # if git exists and cache is newer then load cache
-        t1 = os.path.getmtime(versionCacheFile)
-        t2 = os.path.getmtime(gitIndexFile)
-        if t1 > t2:
-            loadCache = True
-
-    if os.path.exists(versionCacheFile) and os.path.exists(versionPyFile):
-        # if git does not exists and cache is newer then _version.py load cache
-        t1 = os.path.getmtime(versionCacheFile)
-        t2 = os.path.getmtime(versionPyFile)
-        if t1 > t2:
-            loadCache = True
-
-    if loadCache is True and cache is True:
+    versionPyFile = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 '_version.py')
+
+    # The cache is shared by all installations of the user. The key (git
+    # index or _version.py of this installation with its mtime) decides if
+    # it belongs to us and is up to date, so git is only called on changes.
+    keyFile = gitIndexFile if os.path.exists(gitIndexFile) else versionPyFile
+    cacheKey = ''
+    if os.path.exists(keyFile):
+        cacheKey = '{0} {1}'.format(keyFile, os.path.getmtime(keyFile))
+
+    if cache is True and cacheKey and os.path.exists(versionCacheFile):
         with open(versionCacheFile, 'r') as fi:
-            __version__ = fi.read()
+            key, _, version = fi.read().partition('\n')
+
+        if key == cacheKey:
+            __version__ = version
             debug('Loaded version info from cache.',
                   versionCacheFile, __version__)
-        return __version__
+            return __version__
 
     debug('Fetching version info.')
     from ._version import get_versions
@@ -197,7 +232,7 @@ def findVersion(cache=True):  # careful: cache is already imported!
         os.makedirs(os.path.dirname(versionCacheFile), exist_ok=True)
 
     with open(versionCacheFile, 'w') as fi:
-        fi.write(__version__)
+        fi.write(cacheKey + '\n' + __version__)
         debug('Wrote version info to cache:', versionCacheFile, __version__)
 
     return __version__
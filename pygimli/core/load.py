@@ -14,7 +14,6 @@ from pygimli.meshtools import (readFenicsHDF5Mesh, readGmsh, readPLC, readSTL,
                                readMeshIO)
 from pygimli.utils import readGPX
 # from pygimli.utils import cache  # not used yet
-from pygimli.physics.traveltime import load as loadTT
 
 
 __gimliExampleDataRepo__ = 'gimli-org/example-data/'
@@ -122,6 +121,9 @@ def load(fname, verbose=False, testAll=True, realName=None):
     >>> mesh.cellCount()
     4
     """
+    # import locally, pygimli.physics pulls in viewer, frameworks and mpl
+    from pygimli.physics.traveltime import load as loadTT
+
     ImportFilter = {
         # maybe inflate the importer list from the submodules itself.
         # Data
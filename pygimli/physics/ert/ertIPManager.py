@@ -1,4 +1,6 @@
 """ERT manager (derived) with FD or TD IP inversion."""
+import numpy as np
+
 import pygimli as pg
 from .ertManager import ERTManager
 from .ipModelling import DCIPMModelling
@@ -28,8 +30,10 @@ class ERTIPManager(ERTManager):
         """IP inversion in time domain."""
         if isinstance(ipdata, str):
             ipdata = self.data[ipdata]
-        if max(ipdata) > 1:  # mV/V
-            ipdata /= 1000
+        ipdata = np.ascontiguousarray(ipdata, dtype=float)  # one conversion
+        if ipdata.max() > 1:  # mV/V
+            # out-of-place, the array may share memory with self.data
+            ipdata = ipdata * 1e-3
         mesh0 = pg.Mesh(self.paraDomain)
         mesh0.setCellMarkers(mesh0.cellCount())
         fopIP = DCIPMModelling(self.fop, mesh0, self.model, response=self.inv.response)
@@ -38,11 +42,13 @@ class ERTIPManager(ERTManager):
         invIP.modelTrans = pg.trans.TransLogLU(0.0, 1.0)
         relErr = kwargs.pop("relativeError", 0.03)
         absErr = kwargs.pop("absoluteError", 0.001)
-        errorIP = pg.Vector(self.data.size(), relErr) + absErr / pg.abs(ipdata)
+        errorIP = np.abs(ipdata)  # relErr + absErr/|ip| without temporaries
+        np.divide(absErr, errorIP, out=errorIP)
+        errorIP += relErr
         kwargs.setdefault("lam", 100)
-        kwargs.setdefault("startModel", pg.median(ipdata))
+        kwargs.setdefault("startModel", float(np.median(ipdata)))
         kwargs.setdefault("verbose", True)
-        self.modelIP = invIP.run(ipdata, errorIP, **kwargs)
+        self.modelIP = invIP.run(ipdata, pg.Vector(errorIP), **kwargs)
 
     def invertFDIP(self, **kwargs):
         """IP inversion in frequency domain."""
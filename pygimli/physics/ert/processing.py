@@ -25,23 +25,22 @@ def uniqueERTIndex(data, nI=0, reverse=False, unify=True):
     if nI == 0:
         nI = data.sensorCount() + 1
 
-    if unify:
-        normABMN = {'a': np.minimum(data('a'), data('b')) + 1,
-                    'b': np.maximum(data('a'), data('b')) + 1,
-                    'm': np.minimum(data('m'), data('n')) + 1,
-                    'n': np.maximum(data('m'), data('n')) + 1}
-    else:
-        normABMN = {tok: data[tok] + 1 for tok in "abmn"}
+    ab, mn = [np.stack([np.asarray(data[tok], dtype=np.int64)
+                        for tok in pair], axis=1) for pair in ("ab", "mn")]
+    if unify:  # (min, max) of each bipole in one pass
+        ab.sort(axis=1)
+        mn.sort(axis=1)
 
-    abmn = "abmn"
     if reverse:
-        abmn = "mnab"  # nmba?
+        ab, mn = mn, ab  # nmba?
 
-    ind = 0
-    for el in abmn:
-        ind = ind * nI + normABMN[el]  # data(el)
+    ind = ab[:, 0] + 1  # Horner scheme in-place to avoid large temporaries
+    for col in (ab[:, 1], mn[:, 0], mn[:, 1]):
+        ind *= nI
+        ind += col
+        ind += 1
 
-    return np.array(ind, dtype=np.int64)
+    return ind
 
 def generateDataFromUniqueIndex(ind, data=None, nI=None):
     """Generate data container from unique index."""
@@ -57,19 +56,37 @@ def generateDataFromUniqueIndex(ind, data=None, nI=None):
     nI = nI or scheme.sensorCount() + 1
     scheme.resize(0)  # make sure all data are deleted
     scheme.resize(len(ind))
-    nmba = np.zeros([len(ind), 4], dtype=int)
+    q = np.array(ind, dtype=np.int64)  # copy, do not alter the input
+    nmba = np.empty([len(q), 4], dtype=np.int32)
     for i in range(4):
-        col = ind % nI
-        ind -= col
-        ind = ind // nI
-        nmba[:, i] = col
+        q, nmba[:, i] = np.divmod(q, nI)
 
+    nmba -= 1
     for i, tok in enumerate("nmba"):
-        scheme[tok] = nmba[:, i] - 1
+        scheme[tok] = nmba[:, i]
 
     scheme["valid"] = 1
     return scheme
 
+def _matchIndices(query, ref):
+    """Find matching entries of query in ref by binary search.
+
+    Returns
+    -------
+    iQ, iR : np.array(dtype=int)
+        indices into query and into ref (first occurrence) of all matches
+    """
+    query = np.asarray(query)
+    ref = np.asarray(ref)
+    if len(ref) == 0 or len(query) == 0:
+        return np.array([], dtype=int), np.array([], dtype=int)
+
+    order = np.argsort(ref, kind='stable')
+    refS = ref[order]
+    pos = np.minimum(np.searchsorted(refS, query), len(refS) - 1)
+    iQ = np.nonzero(refS[pos] == query)[0]
+    return iQ, order[pos[iQ]]
+
 def reciprocalIndices(data, onlyOnce=False):
     """Return indices for reciprocal data.
 
@@ -86,15 +103,7 @@ def reciprocalIndices(data, onlyOnce=False):
     """
     unF = uniqueERTIndex(data)
     unB = uniqueERTIndex(data, reverse=True)
-    iF, iB = [], []
-    for i, u in enumerate(unF):
-        ii = np.nonzero(unB == u)[0]
-        if len(ii) > 0:
-            iF.append(i)
-            iB.append(ii[0])
-
-    iF = np.array(iF, dtype=np.int)
-    iB = np.array(iB, dtype=np.int)
+    iF, iB = _matchIndices(unF, unB)
     if onlyOnce:
         return iF[iF < iB], iB[iF < iB]
     else:
@@ -253,84 +262,140 @@ def getReciprocals(data, change=False, remove=False):
 
     unF = uniqueERTIndex(data)
     unB = uniqueERTIndex(data, reverse=True)
-    rF, rB = [], []
+    iB, iF = _matchIndices(unB, unF)
+    r = np.array(data['r'])
+    cur = np.array(data['i'])
+    rF, rB = r[iF], r[iB]
     rec = np.zeros(data.size())
-    data['rec'] = 0
-    for iB in range(data.size()):
-        if unB[iB] in unF:
-            iF = int(np.nonzero(unF == unB[iB])[0][0])
-            rF.append(data['r'][iF])
-            rB.append(data['r'][iB])
-            rec[iB] = (rF[-1]-rB[-1]) / (rF[-1]+rB[-1]) * 2
-            data['rec'][iF] = rec[iB]
-            IF, IB = data['i'][iF], data['i'][iB]  # use currents for weighting
-            if change and data['valid'][iF]:
-                data['r'][iF] = (rF[-1] * IF + rB[-1] * IB) / (IF + IB)
-                data['i'][iF] = (IF**2 + IB**2) / (IF + IB)  # according weight
-                data['u'][iF] = data['r'][iF] * data['i'][iF]
-                if remove:
-                    data['valid'][iB] = 0  # for adding all others later on
-
-    print(len(rF), "reciprocals")
+    rec[iB] = (rF-rB) / (rF+rB) * 2
+    recF = np.zeros(data.size())
+    recF[iF] = rec[iB]
+    data['rec'] = recF
+    if change:
+        valid = np.array(data['valid'], dtype=bool)
+        use = valid[iF]
+        if remove:  # keep only one of each pair (the later one)
+            use &= (iF > iB) | ~valid[iB]
+
+        jF, jB = iF[use], iB[use]
+        IF, IB = cur[jF], cur[jB]  # use currents for weighting
+        r[jF] = (r[jF] * IF + r[jB] * IB) / (IF + IB)
+        cur[jF] = (IF**2 + IB**2) / (IF + IB)  # according weight
+        u = np.array(data['u'])
+        u[jF] = r[jF] * cur[jF]
+        data['r'] = r
+        data['i'] = cur
+        data['u'] = u
+        if remove:
+            data.markInvalid(jB)  # for adding all others later on
+
+    print(len(iB), "reciprocals")
     if remove:
         data.removeInvalid()
 
 
 def extractReciprocals(fwd, bwd):
     """Extract reciprocal data from forward/backward DataContainers."""
-    nMax = max(fwd.sensorCount(), bwd.sensorCount())
-    unF = uniqueERTIndex(fwd, nI=nMax)
-    unB = uniqueERTIndex(bwd, nI=nMax, reverse=True)
-    rF, rB = [], []
+    nI = max(fwd.sensorCount(), bwd.sensorCount()) + 1
+    unF = uniqueERTIndex(fwd, nI=nI)
+    unB = uniqueERTIndex(bwd, nI=nI, reverse=True)
+    iB, iF = _matchIndices(unB, unF)
+    rF, rB = np.array(fwd['r'])[iF], np.array(bwd['r'])[iB]
+    IF, IB = np.array(fwd['i'])[iF], np.array(bwd['i'])[iB]  # for weighting
     rec = np.zeros(bwd.size())
+    rec[iB] = (rF-rB) / (rF+rB) * 2
     both = pg.DataContainerERT(fwd)
-    both.set('rec', pg.Vector(both.size()))
     back = pg.DataContainerERT(bwd)
     back.set('rec', pg.Vector(back.size()))
-    for iB in range(bwd.size()):
-        if unB[iB] in unF:
-            iF = int(np.nonzero(unF == unB[iB])[0][0])
-            rF.append(fwd('r')[iF])
-            rB.append(bwd('r')[iB])
-            rec[iB] = (rF[-1]-rB[-1]) / (rF[-1]+rB[-1]) * 2
-            both('rec')[iF] = rec[iB]
-            IF, IB = fwd('i')[iF], bwd('i')[iB]  # use currents for weighting
-            both('r')[iF] = (rF[-1] * IF + rB[-1] * IB) / (IF + IB)
-            both('i')[iF] = (IF**2 + IB**2) / (IF + IB)  # according to weight
-            both('u')[iF] = fwd('r')[iF] * fwd('i')[iF]
-            back('valid')[iB] = 0  # for adding all others later on
-    print(len(rF), "reciprocals")
+    recF = np.zeros(both.size())
+    recF[iF] = rec[iB]
+    both.set('rec', pg.Vector(recF))
+    r, cur, u = [np.array(both[tok]) for tok in "riu"]
+    r[iF] = (rF * IF + rB * IB) / (IF + IB)
+    cur[iF] = (IF**2 + IB**2) / (IF + IB)  # according to weight
+    u[iF] = r[iF] * cur[iF]
+    both['r'] = r
+    both['i'] = cur
+    both['u'] = u
+    back.markInvalid(iB)  # for adding all others later on
+    print(len(iB), "reciprocals")
     back.removeInvalid()
     both.add(back)
     return rec, both
 
-def combineMultipleData(DATA):
-    """Combine multiple data containers into data/err matrices."""
+def combineMultipleData(DATA, dense=True):
+    """Combine multiple data containers into data/err matrices.
+
+    Parameters
+    ----------
+    DATA : [DataContainerERT] | [str]
+        data containers or file names to combine
+    dense : bool [True]
+        return dense arrays with NaN for missing data, otherwise sparse
+        matrices (scipy.sparse.csc_matrix) storing only the measured data
+
+    Returns
+    -------
+    scheme : DataContainerERT
+        scheme holding all unique quadrupoles
+    RHOA, ERR : np.array | scipy.sparse.csc_matrix
+        apparent resistivity and error matrices of size (nData, len(DATA))
+    """
     assert hasattr(DATA, '__iter__'), "DATA should be DataContainers or str!"
     if isinstance(DATA[0], str):  # read in if strings given
         DATA = [pg.DataContainerERT(data) for data in DATA]
 
     nEls = [data.sensorCount() for data in DATA]
     assert max(np.abs(np.diff(nEls))) == 0, "Electrodes not equal"
-    uIs = [uniqueERTIndex(data) for data in DATA]
+    nI = max(nEls) + 1  # same basis for all indices, no need to recompute
+    uIs = [uniqueERTIndex(data, nI=nI) for data in DATA]
     uI = np.unique(np.hstack(uIs))
-    scheme = generateDataFromUniqueIndex(uI, DATA[0])
-    uI = uniqueERTIndex(scheme)   #, unify=False)
-    R = np.ones([scheme.size(), len(DATA)]) * np.nan
-    ERR = np.zeros_like(R)
+    scheme = generateDataFromUniqueIndex(uI, DATA[0], nI=nI)
+    iis = [np.searchsorted(uI, uIi) for uIi in uIs]
     if not scheme.haveData('k'):  # just do that only once
-        scheme['k'] = createGeometricFactors(scheme)  # check numerical
+        k = np.zeros(scheme.size())
+        for ii, di in zip(iis, DATA):  # reuse given (e.g. numerical) factors
+            if di.allNonZero('k'):
+                # scheme bipoles are sorted, swapping one of them flips k
+                flip = (di['a'] > di['b']) != (di['m'] > di['n'])
+                k[ii] = np.where(flip, -1., 1.) * np.asarray(di['k'])
+
+        if np.all(k != 0):
+            scheme['k'] = k
+        else:
+            scheme['k'] = createGeometricFactors(scheme)  # check numerical
 
-    for i, di in enumerate(DATA):
-        ii = np.searchsorted(uI, uIs[i])
+    k = np.asarray(scheme['k'])  # convert only once
+    rows, cols, rVals, errVals = [], [], [], []
+    for i, (ii, di) in enumerate(zip(iis, DATA)):
         if not di.haveData('r'):
             if di.allNonZero('u') and di.allNonZero('i'):
-                di['r'] = di['u']/di['i']
+                di['r'] = np.asarray(di['u']) / np.asarray(di['i'])
             elif di.allNonZero('rhoa'):
-                di['r'] = di['rhoa'] / scheme['k'][ii]
+                di['r'] = np.asarray(di['rhoa']) / k[ii]
+
+        # quadrupoles measured more than once (or as b a m n): last one wins
+        _, last = np.unique(ii[::-1], return_index=True)
+        keep = len(ii) - 1 - last
+        rows.append(ii[keep])
+        cols.append(np.full(len(keep), i))
+        rVals.append(np.asarray(di['r'])[keep])
+        errVals.append(np.asarray(di['err'])[keep])
+
+    rows, cols = np.hstack(rows), np.hstack(cols)
+    rVals, errVals = np.hstack(rVals), np.hstack(errVals)
+    shape = (scheme.size(), len(DATA))
+    if dense:
+        R = np.full(shape, np.nan)
+        R[rows, cols] = rVals
+        ERR = np.zeros(shape)
+        ERR[rows, cols] = errVals
+        RHOA = np.abs(k[:, np.newaxis] * R)
+    else:
+        from scipy import sparse
 
-        R[ii, i] = di['r']
-        ERR[ii, i] = di['err']
+        R = sparse.coo_matrix((rVals, (rows, cols)), shape=shape).tocsc()
+        ERR = sparse.coo_matrix((errVals, (rows, cols)), shape=shape).tocsc()
+        RHOA = abs(sparse.diags(k) @ R).tocsc()
 
-    RHOA = np.abs(np.reshape(scheme['k'], [-1, 1]) * R)
     return scheme, RHOA, ERR
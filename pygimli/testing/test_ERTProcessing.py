@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import unittest
+
+import numpy as np
+
+import pygimli as pg
+from pygimli.physics.ert import processing
+
+
+def createData(abmn, nSensors=6, **kwargs):
+    """Create ERT data with given sensor indices and data fields."""
+    data = pg.DataContainerERT()
+    data.setSensors(pg.utils.grange(0, nSensors-1, n=nSensors))
+    for i, q in enumerate(abmn):
+        data.addFourPointData(*q, **{k: v[i] for k, v in kwargs.items()})
+    return data
+
+
+class TestERTProcessing(unittest.TestCase):
+
+    def test_uniqueERTIndex(self):
+        """Default basis sensorCount+1 also separates unsorted pole data."""
+        data = createData([[-1, 0, -1, 3], [-1, 0, 0, -1]], nSensors=4)
+        ind = processing.uniqueERTIndex(data, unify=False)
+        self.assertEqual(len(np.unique(ind)), 2)
+        # base sensorCount maps both to the same index
+        ind = processing.uniqueERTIndex(data, nI=data.sensorCount(),
+                                        unify=False)
+        self.assertEqual(len(np.unique(ind)), 1)
+
+    def test_getReciprocals(self):
+        """Reciprocity and current-weighted mean of normal/reciprocal."""
+        def data():
+            return createData([[0, 1, 2, 3], [2, 3, 0, 1], [0, 1, 3, 4]],
+                              r=[10., 12., 5.], i=[1., 3., 1.],
+                              u=[10., 36., 5.])
+
+        d = data()
+        processing.getReciprocals(d)
+        np.testing.assert_allclose(d['rec'], [-2/11, 2/11, 0])
+        np.testing.assert_allclose(d['r'], [10, 12, 5])
+
+        # both directions averaged from the original values
+        d = data()
+        processing.getReciprocals(d, change=True)
+        np.testing.assert_allclose(d['r'], [11.5, 11.5, 5])
+        np.testing.assert_allclose(d['i'], [2.5, 2.5, 1])
+        np.testing.assert_allclose(d['u'], [28.75, 28.75, 5])
+
+        # the later index of the pair is kept
+        d = data()
+        processing.getReciprocals(d, change=True, remove=True)
+        self.assertEqual(d.size(), 2)
+        np.testing.assert_array_equal(d['a'], [2, 0])
+        np.testing.assert_allclose(d['r'], [11.5, 5])
+        np.testing.assert_allclose(d['i'], [2.5, 1])
+        np.testing.assert_allclose(d['u'], [28.75, 5])
+
+    def test_extractReciprocals(self):
+        """Average forward by backward data and append the remaining."""
+        fwd = createData([[0, 1, 2, 3], [0, 1, 3, 4]],
+                         r=[10., 5.], i=[1., 1.], u=[10., 5.])
+        bwd = createData([[2, 3, 0, 1], [4, 5, 0, 1]],
+                         r=[12., 7.], i=[3., 2.], u=[36., 14.])
+        rec, both = processing.extractReciprocals(fwd, bwd)
+        np.testing.assert_allclose(rec, [-2/11, 0])
+        self.assertEqual(both.size(), 3)
+        np.testing.assert_allclose(both['rec'], [-2/11, 0, 0])
+        np.testing.assert_allclose(both['r'], [11.5, 5, 7])
+        np.testing.assert_allclose(both['i'], [2.5, 1, 2])
+        np.testing.assert_allclose(both['u'], [28.75, 5, 14])
+
+    def test_combineMultipleDataK(self):
+        """Given geometric factors follow the sorted scheme bipoles."""
+        d1 = createData([[1, 0, 2, 3]], k=[-5.], r=[-2.], err=[0.01])
+        d2 = createData([[0, 1, 2, 3], [0, 1, 4, 3]], k=[5., -7.],
+                        r=[2., -1.], err=[0.02, 0.03])
+        scheme, RHOA, _ = processing.combineMultipleData([d1, d2])
+        np.testing.assert_array_equal(scheme['a'], [0, 0])
+        np.testing.assert_array_equal(scheme['n'], [3, 4])
+        np.testing.assert_allclose(scheme['k'], [5, 7])
+        np.testing.assert_allclose(RHOA, [[10, 10], [np.nan, 7]])
+
+    def test_combineMultipleDataSparse(self):
+        """Dense and sparse matrices agree, also for duplicate data."""
+        d1 = createData([[0, 1, 2, 3], [1, 0, 2, 3], [0, 1, 3, 4]],
+                        k=[5., -5., 7.], r=[-2., 2., 1.],
+                        err=[0.01, 0.02, 0.03])
+        d2 = createData([[0, 1, 2, 3], [0, 1, 4, 5]], k=[5., 9.],
+                        r=[3., 1.], err=[0.04, 0.05])
+        scheme, RHOA, ERR = processing.combineMultipleData([d1, d2])
+        _, sRHOA, sERR = processing.combineMultipleData([d1, d2],
+                                                        dense=False)
+        # duplicate 0 1 2 3 / 1 0 2 3 in d1: the last one is used
+        np.testing.assert_allclose(RHOA, [[10, 15], [7, np.nan],
+                                          [np.nan, 9]])
+        np.testing.assert_allclose(ERR, [[0.02, 0.04], [0.03, 0],
+                                         [0, 0.05]])
+        np.testing.assert_allclose(sRHOA.toarray(), np.nan_to_num(RHOA))
+        np.testing.assert_allclose(sERR.toarray(), ERR)
+
+
+if __name__ == '__main__':
+    unittest.main()
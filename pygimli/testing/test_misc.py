@@ -215,6 +215,21 @@ class TestMisc(unittest.TestCase):
     def test_DataTypes(self):
         pg.core.showSizes()
 
+    def test_LazyImport(self):
+        """Expensive submodules are only imported on first access."""
+        import subprocess
+        import sys
+
+        lazy = ['pygimli.viewer', 'pygimli.frameworks', 'pygimli.testing',
+                'pygimli.physics', 'matplotlib']
+        code = ("import sys; import pygimli as pg; "
+                "print(' '.join(m for m in {0} if m in sys.modules)); "
+                "pg.show; print('pygimli.viewer' in sys.modules)")
+        out = subprocess.check_output([sys.executable, "-c",
+                                       code.format(lazy)]).decode().split("\n")
+        self.assertEqual(out[-3], '')  # none loaded by import pygimli
+        self.assertEqual(out[-2], 'True')  # but by first access
+
 
 if __name__ == '__main__':
     pg.core.setDeepDebug(0)